@@ -1,11 +1,18 @@
+import os
+from jinja2 import (
+    Environment, FileSystemBytecodeCache, FileSystemLoader, pass_context
+)
+from markupsafe import Markup, escape
 from starlette.applications import Starlette
-from starlette.responses import RedirectResponse
-from starlette.templating import Jinja2Templates
+from starlette.exceptions import HTTPException
+from starlette.responses import HTMLResponse, RedirectResponse
 from starlette.routing import Route
 from tortoise.contrib.starlette import register_tortoise
 from tortoise import Tortoise
 from secure import SecureHeaders
-from wtftortoise.orm import model_form
+from wtforms import widgets
+from wtforms.widgets.html5 import NumberInput
+from wtftortoise.orm import model_fields, model_form
 from models import Book
 
 # Security Headers are HTTP response headers that, when set,
@@ -14,47 +21,165 @@ from models import Book
 # more on https://secure.readthedocs.io/en/latest/headers.html
 secure_headers = SecureHeaders()
 
-templates = Jinja2Templates(directory="templates")
+BookForm = model_form(Book, exclude=["id", "created"])
+
+# Only the primary key and the columns shown in BookForm are loaded by edit().
+_FORM_FIELDS = list(model_fields(Book, exclude=["id", "created"]))
+_EDIT_FIELDS = [Book._meta.pk_attr] + _FORM_FIELDS
+
+
+def compile_form_renderer(form_class):
+    """
+    Returns a function rendering a ``form_class`` instance as Bootstrap form
+    groups. The markup around each field's value is built once here, so
+    rendering only escapes the values and errors. Fields with ``render_kw``
+    set, or whose widget isn't a plain text input, a number input without
+    step/min/max, or a textarea, are rendered by WTForms.
+    """
+    parts = []
+    for field in form_class():
+        required = " required" if field.flags.required else ""
+        label = '<label for="{}">{}</label>:'.format(
+            escape(field.id), escape(field.label.text))
+        attrs = 'class="form-control" id="{}" name="{}"{}'.format(
+            escape(field.id), escape(field.name), required)
+        widget = field.widget
+        widget_type = type(widget)
+        if field.render_kw:
+            start = end = None
+        elif widget_type is widgets.TextInput or (
+                widget_type is NumberInput
+                and widget.step is None
+                and widget.min is None
+                and widget.max is None):
+            start = '<input {} type="{}" value="'.format(
+                attrs, field.widget.input_type)
+            end = '">'
+        elif widget_type is widgets.TextArea:
+            start = "<textarea {}>\r\n".format(attrs)
+            end = "</textarea>"
+        else:
+            start = end = None
+        parts.append((field.name, label, start, end))
+
+    def render_form(form):
+        html = []
+        for name, label, start, end in parts:
+            field = form[name]
+            if start is None:
+                widget = field(class_="form-control")
+            else:
+                widget = start + str(escape(field._value())) + end
+            errors = "".join(
+                '<span style="color: red;">*{}</span>'.format(escape(error))
+                for error in field.errors
+            )
+            html.append(
+                f'<div class="form-group">{label}{widget}{errors}</div>')
+        return Markup("".join(html))
+
+    return render_form
+
+
+render_book_form = compile_form_renderer(BookForm)
+
+# Templates are compiled once and never reloaded; compiled bytecode is also
+# kept on disk so restarts don't have to parse them again.
+os.makedirs(".jinja_cache", exist_ok=True)
+env = Environment(
+    loader=FileSystemLoader("templates"),
+    autoescape=True,
+    auto_reload=False,
+    bytecode_cache=FileSystemBytecodeCache(".jinja_cache"),
+    enable_async=False,
+)
+
+
+@pass_context
+def url_for(context, name, **path_params):
+    request = context["request"]
+    return request.url_for(name, **path_params)
+
+
+env.globals["url_for"] = url_for
+env.globals["render_book_form"] = render_book_form
+
+for template_name in env.list_templates():
+    env.get_template(template_name)
+
+
+def render(name, context):
+    """Renders the template ``name`` with ``context`` as an HTML response."""
+    return HTMLResponse(env.get_template(name).render(context))
+
+
+# Request-independent state for list_all(), populated by init_list_all()
+# on startup once Tortoise has initialised the models.
+_FIELD_NAME_LIST = []
+_MENU = ()
+_list_query = None
+
+# DELETE statement used by delete(), built by init_delete() on startup.
+_DELETE_SQL = None
+
+
+def _display_field(model):
+    """Returns the name of the field used to display a related ``model``."""
+    for name, field in model._meta.fields_map.items():
+        if type(field).__name__ == "CharField":
+            return name
+    return model._meta.pk_attr
+
+
+def list_fields(model):
+    """
+    Returns the field names to select when listing ``model``. Foreign keys
+    are projected as ``<fk>__<field>`` so they are joined into the same
+    query instead of being fetched separately; their ``<fk>_id`` source
+    columns are left out. Many-to-many fields aren't listed.
+    """
+    model_describe = Tortoise.describe_model(model)
+    fields_map = model._meta.fields_map
+    fk_fields = model_describe["fk_fields"]
+    source_fields = {m["raw_field"] for m in fk_fields}
+    field_names = [model_describe["pk_field"]["name"]]
+    field_names += [m["name"] for m in model_describe["data_fields"]
+                    if m["name"] not in source_fields]
+    for m in fk_fields:
+        related_model = fields_map[m["name"]].related_model
+        field_names.append(m["name"] + "__" + _display_field(related_model))
+    return field_names
+
+
+def values_query(model, field_names):
+    """Returns a callable building the ``.values()`` query for a list."""
+    def query():
+        return model.all().values(*field_names)
+    return query
 
 
 async def list_all(request):
-    menu = Tortoise.apps.get("models")
-    model_describe = Tortoise.describe_model(Book)
-    fk_fields = [m["name"] for m in model_describe.get("fk_fields")]
-    backward_fk_fields = [m["name"]
-                          for m in model_describe.get("backward_fk_fields")]
-    field_name_list = [
-        i for i in Book._meta.fields_map if i not in backward_fk_fields]
-    if fk_fields:
-        results = (
-            await Book.all()
-            .prefetch_related(*fk_fields)
-        )
-    else:
-        results = (
-            await Book.all()
-            .values(*field_name_list)
-        )
-    return templates.TemplateResponse(
+    results = await _list_query()
+    return render(
         "list.html", {
             "request": request,
             "results": results,
-            "field_name_list": [i for i in field_name_list],
-            "menu": [i for i in menu]
+            "field_name_list": _FIELD_NAME_LIST,
+            "menu": _MENU
         }
     )
 
 
 async def create(request):
-    BookForm = model_form(Book, exclude=["id", "created"])
-    data = await request.form()
-    form = BookForm(data)
-    instance = Book()
     if request.method == "POST":
+        data = await request.form()
+        form = BookForm(data)
+        instance = Book()
         form.populate_obj(instance)
         await instance.save()
         return RedirectResponse(url="/", status_code=302)
-    return templates.TemplateResponse(
+    form = BookForm()
+    return render(
         "create.html", {
             "request": request,
             "form": form,
@@ -65,15 +190,19 @@ async def create(request):
 
 async def edit(request):
     id = request.path_params["id"]
-    item = await Book.get(id=id)
-    data = await request.form()
-    BookForm = model_form(Book, exclude=["id", "created"])
-    form = BookForm(obj=item, formdata=data)
-    if request.method == "POST" and form.validate():
-        form.populate_obj(item)
-        await item.save()
-        return RedirectResponse(url="/", status_code=302)
-    return templates.TemplateResponse(
+    item = await Book.filter(id=id).only(*_EDIT_FIELDS).first()
+    if item is None:
+        raise HTTPException(status_code=404)
+    if request.method == "POST":
+        data = await request.form()
+        form = BookForm(obj=item, formdata=data)
+        if form.validate():
+            form.populate_obj(item)
+            await item.save(update_fields=_FORM_FIELDS)
+            return RedirectResponse(url="/", status_code=302)
+    else:
+        form = BookForm(obj=item)
+    return render(
         "edit.html", {
             "request": request,
             "form": form,
@@ -84,7 +213,10 @@ async def edit(request):
 
 async def delete(request):
     id = request.path_params["id"]
-    await Book.get(id=id).delete()
+    # Book has no delete signals, so the row is removed with a plain DELETE
+    # instead of going through the QuerySet builder.
+    await Book._meta.db.execute_query(
+        _DELETE_SQL, [Book._meta.pk.to_db_value(id, Book)])
     response = RedirectResponse(url="/", status_code=302)
     return response
 
@@ -115,3 +247,27 @@ register_tortoise(
     modules={"models": ["models"]},
     generate_schemas=True
 )
+
+
+# Registered after register_tortoise() so it runs once the models are ready.
+@app.on_event("startup")
+async def init_list_all():
+    global _MENU, _list_query
+    _FIELD_NAME_LIST[:] = list_fields(Book)
+    _MENU = tuple(Tortoise.apps.get("models"))
+    _list_query = values_query(Book, _FIELD_NAME_LIST)
+
+
+@app.on_event("startup")
+async def init_delete():
+    global _DELETE_SQL
+    # Reuse the parameterised statement Tortoise prepares for Model.delete(),
+    # so it's in the dialect of whichever database the model is bound to.
+    executor = Book._meta.db.executor_class(model=Book, db=Book._meta.db)
+    _DELETE_SQL = executor.delete_query
+
+
+# uvicorn runs on uvloop by default when it's installed.
+if __name__ == "__main__":
+    import uvicorn
+    uvicorn.run(app)
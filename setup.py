@@ -1,5 +1,14 @@
+import os
+
 import setuptools
 
+# Set WTFTORTOISE_MYPYC=1 to compile wtftortoise.orm with mypyc. The pure
+# Python module is still shipped and used wherever no extension is built.
+ext_modules = []
+if os.environ.get("WTFTORTOISE_MYPYC") == "1":
+    from mypyc.build import mypycify
+    ext_modules = mypycify(["src/wtftortoise/orm.py"])
+
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
 
@@ -23,5 +32,9 @@ setuptools.setup(
     package_dir={"": "src"},
     packages=setuptools.find_packages(where="src"),
     install_requires=["tortoise-orm", "uvicorn", "wtforms", "wtforms[email]"],
+    extras_require={
+        "test": ["pytest", "pytest-asyncio>=0.24"],
+    },
+    ext_modules=ext_modules,
     python_requires=">=3.7",
 )
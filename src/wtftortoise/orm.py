@@ -53,76 +53,179 @@ The form can be generated setting field arguments:
            'label': 'Your new label',
        }
    })
+
+Generated form classes are cached, so calling ``model_form`` again with the
+same arguments returns the same class. The class is shared: setting
+attributes on it changes the form for every caller, so subclass it instead.
+Forms are only cached when neither ``base_class`` nor ``converter`` is given
+and ``field_args`` holds nothing but strings, numbers, booleans and None, in
+dicts, lists, tuples and sets. Anything else, such as validator instances, is
+generated on every call. ``model_fields`` isn't cached: it always returns new
+fields, which the caller is free to modify.
 """
+from typing import (
+    Any, Callable, ClassVar, Dict, Iterable, List, Mapping, Optional, Tuple,
+    Type
+)
+
+from tortoise import fields as tortoise_fields
+from tortoise.models import Model
 from wtforms import Form, validators, fields as f
 from wtforms.validators import DataRequired
 from wtforms.fields import html5
+from wtforms.fields.core import UnboundField
+
+try:
+    from mypy_extensions import mypyc_attr
+except ImportError:  # pragma: no cover
+    def mypyc_attr(*attrs, **kwattrs):  # type: ignore[misc]
+        return lambda cls: cls
+
+# The callable a converter maps a property type name to.
+Converter = Callable[[Type[Model], tortoise_fields.Field, Dict[str, Any]],
+                     Optional[UnboundField]]
 
+# Validators are stateless, so the same instances are shared by every field.
+_LEN_255 = validators.Length(max=255)
+_LEN_36 = validators.Length(max=36)
+_DATA_REQUIRED = DataRequired()
 
-def convert_IntField(model, prop, kwargs):
+
+def convert_IntField(model: Type[Model], prop: tortoise_fields.Field,
+                     kwargs: Dict[str, Any]) -> UnboundField:
     """Returns a form field for a IntField."""
     return html5.IntegerField()
 
 
-def convert_SmallIntField(model, prop, kwargs):
+def convert_SmallIntField(model: Type[Model], prop: tortoise_fields.Field,
+                          kwargs: Dict[str, Any]) -> UnboundField:
     """Returns a form field for a SmallIntField."""
     return html5.IntegerField()
 
 
-def convert_BigIntField(model, prop, kwargs):
+def convert_BigIntField(model: Type[Model], prop: tortoise_fields.Field,
+                        kwargs: Dict[str, Any]) -> UnboundField:
     """Returns a form field for a BigIntField."""
     return html5.IntegerField()
 
 
-def convert_CharField(model, prop, kwargs):
+def convert_CharField(model: Type[Model], prop: tortoise_fields.Field,
+                      kwargs: Dict[str, Any]) -> UnboundField:
     """Returns a form field for a CharField."""
-    kwargs['validators'].append(validators.length(max=255))
+    kwargs['validators'].append(_LEN_255)
     return f.StringField(**kwargs)
 
 
-def convert_TextField(model, prop, kwargs):
+def convert_TextField(model: Type[Model], prop: tortoise_fields.Field,
+                      kwargs: Dict[str, Any]) -> UnboundField:
     """Returns a form field for a TextField."""
     return f.TextAreaField(**kwargs)
 
 
-def convert_UUIDField(model, prop, kwargs):
+def convert_UUIDField(model: Type[Model], prop: tortoise_fields.Field,
+                      kwargs: Dict[str, Any]) -> UnboundField:
     """Returns a form field for a CharField."""
-    kwargs['validators'].append(validators.length(max=36))
+    kwargs['validators'].append(_LEN_36)
     return f.StringField(**kwargs)
 
 
-def convert_BooleanField(model, prop, kwargs):
+def convert_BooleanField(model: Type[Model], prop: tortoise_fields.Field,
+                         kwargs: Dict[str, Any]) -> UnboundField:
     """Returns a form field for a BooleanField."""
     return f.BooleanField(**kwargs)
 
 
-def convert_FloatField(model, prop, kwargs):
+def convert_FloatField(model: Type[Model], prop: tortoise_fields.Field,
+                       kwargs: Dict[str, Any]) -> UnboundField:
     """Returns a form field for a FloatField."""
     return f.FloatField(**kwargs)
 
 
-def convert_DecimalField(model, prop, kwargs):
+def convert_DecimalField(model: Type[Model], prop: tortoise_fields.Field,
+                         kwargs: Dict[str, Any]) -> UnboundField:
     """Returns a form field for a DecimalField."""
     return f.FloatField(**kwargs)
 
 
-def convert_DateTimeField(model, prop, kwargs):
+def convert_DateTimeField(model: Type[Model], prop: tortoise_fields.Field,
+                          kwargs: Dict[str, Any]) -> UnboundField:
     """Returns a form field for a DateTimeField."""
     return f.DateTimeField(**kwargs)
 
 
-def convert_DateField(model, prop, kwargs):
+def convert_DateField(model: Type[Model], prop: tortoise_fields.Field,
+                      kwargs: Dict[str, Any]) -> UnboundField:
     """Returns a form field for a DateField."""
     return f.DateField(**kwargs)
 
 
+# Values field_args may contain, inside dicts, lists, tuples and sets, for
+# a generated form to be cached.
+_CACHEABLE_TYPES = (str, int, float, bool, bytes, type(None))
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Returns a hashable version of ``value`` for use in a cache key. Every
+    value is tagged with its type, so ``1``, ``True`` and ``1.0`` (or a
+    list and a tuple of the same items) give different keys. Raises
+    TypeError for values other than containers and _CACHEABLE_TYPES.
+    """
+    value_type = type(value)
+    if isinstance(value, dict):
+        return (value_type, tuple(sorted(
+            (_freeze(k), _freeze(v)) for k, v in value.items())))
+    if isinstance(value, (list, tuple)):
+        return (value_type, tuple(_freeze(v) for v in value))
+    if isinstance(value, (set, frozenset)):
+        return (value_type, frozenset(_freeze(v) for v in value))
+    if value_type in _CACHEABLE_TYPES:
+        return (value_type, value)
+    raise TypeError('%r is not cacheable' % (value,))
+
+
+def _cache_key(model: Type[Model], base_class: Type[Form],
+               only: Optional[Iterable[str]],
+               exclude: Optional[Iterable[str]],
+               field_args: Optional[Mapping[str, Any]],
+               converter: Optional['ModelConverter']) -> Optional[tuple]:
+    """
+    Returns the cache key for generating a form with these arguments, or
+    None if the result must not be cached. Forms built with a custom base
+    class or converter, or with field_args holding anything but plain
+    values (such as validator instances), aren't cached: those objects are
+    usually created per call and would otherwise keep adding entries. The
+    default converters are part of the key, so changing them in place isn't
+    hidden by forms cached earlier.
+    """
+    if base_class is not Form or converter is not None:
+        return None
+    try:
+        return (model, _freeze(only), _freeze(exclude),
+                _freeze(field_args),
+                tuple(ModelConverter.default_converters.items()))
+    except TypeError:
+        return None
+
+
+# Cache for model_form(), keyed by its arguments.
+_form_cache: Dict[tuple, Type[Form]] = {}
+
+
+# Compiled with mypyc, ModelConverter must stay open to Python subclasses.
+@mypyc_attr(allow_interpreted_subclasses=True)
 class ModelConverter:
     """
     Converts properties from a Model class to form fields.
     Default conversions between properties and fields:
+
+    Instances only hold ``converters`` and have no ``__dict__``. Subclasses
+    that don't declare ``__slots__`` themselves get one back as usual.
     """
 
-    default_converters = {
+    __slots__ = ('converters',)
+
+    default_converters: ClassVar[Dict[str, Converter]] = {
         'CharField': convert_CharField,
         'TextField': convert_TextField,
         'UUIDField': convert_UUIDField,
@@ -135,7 +238,8 @@ class ModelConverter:
         'DateField': convert_DateField,
     }
 
-    def __init__(self, converters=None):
+    def __init__(self,
+                 converters: Optional[Dict[str, Converter]] = None) -> None:
         """
         Constructs the converter, setting the converter callables.
 
@@ -145,7 +249,9 @@ class ModelConverter:
         """
         self.converters = converters or self.default_converters
 
-    def convert(self, model, prop, field_args):
+    def convert(self, model: Type[Model], prop: tortoise_fields.Field,
+                field_args: Optional[Mapping[str, Any]]
+                ) -> Optional[UnboundField]:
         """
         Returns a form field for a single model property.
 
@@ -156,25 +262,57 @@ class ModelConverter:
         :param field_args:
             Optional keyword arguments to construct the field.
         """
-        prop_type_name = type(prop).__name__
-        kwargs = {
+        converter = self._get_converter(prop)
+        if converter is not None:
+            return converter(model, prop, self._field_kwargs(prop, field_args))
+        return None
+
+    def _get_converter(self, prop: tortoise_fields.Field
+                       ) -> Optional[Converter]:
+        """Returns the converter callable for ``prop``, if there is one."""
+        converter = self.converters.get(type(prop).__name__, None)
+        # The class-keyed table is built at import time, so only use its
+        # entry while the mapping still holds the same converter.
+        by_class = _default_converters_by_class.get(type(prop))
+        if by_class is not None and by_class is converter:
+            return by_class
+        return converter
+
+    def _field_kwargs(self, prop: tortoise_fields.Field,
+                      field_args: Optional[Mapping[str, Any]]
+                      ) -> Dict[str, Any]:
+        """Returns the keyword arguments to construct a field for ``prop``."""
+        kwargs: Dict[str, Any] = {
             'label': prop.model_field_name.title(),
             'default': prop.default,
             'validators': [],
         }
         if field_args:
             kwargs.update(field_args)
+            # Copy the validators so the caller's field_args isn't mutated.
+            kwargs['validators'] = list(kwargs['validators'])
 
         if prop.required:
-            kwargs['validators'].append(DataRequired())
-
-        converter = self.converters.get(prop_type_name, None)
-        if converter is not None:
-            return converter(model, prop, kwargs)
-
-
-def model_fields(model, only=None, exclude=None, field_args=None,
-                 converter=None):
+            kwargs['validators'].append(_DATA_REQUIRED)
+        return kwargs
+
+
+# ModelConverter.default_converters keyed by the Tortoise field classes
+# themselves, so the default converter doesn't have to look up fields by
+# their type name.
+_default_converters_by_class: Dict[type, Converter] = {
+    getattr(tortoise_fields, name): converter
+    for name, converter in ModelConverter.default_converters.items()
+    if hasattr(tortoise_fields, name)
+}
+
+
+def model_fields(model: Type[Model],
+                 only: Optional[Iterable[str]] = None,
+                 exclude: Optional[Iterable[str]] = None,
+                 field_args: Optional[Mapping[str, Any]] = None,
+                 converter: Optional[ModelConverter] = None
+                 ) -> Dict[str, UnboundField]:
     """
     Extracts and returns a dictionary of form fields for a given
     Model class.
@@ -194,31 +332,64 @@ def model_fields(model, only=None, exclude=None, field_args=None,
         A converter to generate the fields based on the model properties. If
         not set, ModelConverter is used.
     """
+    # Create all fields.
+    plan = _build_plan(model, only, exclude, field_args, converter)
+    fields = ((name, fn(model, prop, kw)) for name, fn, prop, kw in plan)
+    return {name: field for name, field in fields if field is not None}
+
+
+def _build_plan(model: Type[Model], only: Optional[Iterable[str]],
+                exclude: Optional[Iterable[str]],
+                field_args: Optional[Mapping[str, Any]],
+                converter: Optional[ModelConverter]
+                ) -> List[Tuple[str, Callable, tortoise_fields.Field, Any]]:
+    """
+    Returns a ``(name, fn, prop, kwargs)`` tuple for each field to create,
+    so that ``fn(model, prop, kwargs)`` returns the field. Converter lookup
+    and keyword argument building are done here, leaving the field creation
+    loop in model_fields() free of dispatch.
+    """
     converter = converter or ModelConverter()
     field_args = field_args or {}
 
     # Get the field names we want to include or exclude, starting with the
     # full list of model properties.
     props = model._meta.fields_map
-    field_names = [prop for prop in props]
+    field_names: Iterable[str]
 
     if only:
-        field_names = [f for f in only if f in field_names]
+        field_names = [name for name in only if name in props]
 
     elif exclude:
-        field_names = [f for f in field_names if f not in exclude]
+        exclude = frozenset(exclude)
+        field_names = [name for name in props if name not in exclude]
 
-    # Create all fields.
-    field_dict = {}
-    for name in field_names:
-        field = converter.convert(model, props[name], field_args.get(name))
-        if field is not None:
-            field_dict[name] = field
-    return field_dict
+    else:
+        field_names = props
 
+    # A subclass overriding convert() is called as is, with the field's
+    # field_args in place of the prepared keyword arguments.
+    if type(converter).convert is not ModelConverter.convert:
+        return [
+            (name, converter.convert, props[name], field_args.get(name))
+            for name in field_names
+        ]
 
-def model_form(model, base_class=Form, only=None, exclude=None,
-               field_args=None, converter=None):
+    plan = []
+    for name in field_names:
+        prop = props[name]
+        fn = converter._get_converter(prop)
+        if fn is not None:
+            kwargs = converter._field_kwargs(prop, field_args.get(name))
+            plan.append((name, fn, prop, kwargs))
+    return plan
+
+
+def model_form(model: Type[Model], base_class: Type[Form] = Form,
+               only: Optional[Iterable[str]] = None,
+               exclude: Optional[Iterable[str]] = None,
+               field_args: Optional[Mapping[str, Any]] = None,
+               converter: Optional[ModelConverter] = None) -> Type[Form]:
     """
     Creates and returns a dynamic ``wtforms.Form`` class for a given
     Model class. The form class can be used as it is or serve as a base
@@ -242,9 +413,16 @@ def model_form(model, base_class=Form, only=None, exclude=None,
         A converter to generate the fields based on the model properties. If
         not set, ModelConverter is used.
     """
+    key = _cache_key(model, base_class, only, exclude, field_args, converter)
+    if key is not None and key in _form_cache:
+        return _form_cache[key]
+
     # Extract the fields from the model.
     field_dict = model_fields(model, only, exclude, field_args, converter)
 
     # Return a dynamically created form class, extending from base_class and
     # including the created fields as properties.
-    return type(model.__name__ + 'Form', (base_class,), field_dict)
+    form_class = type(model.__name__ + 'Form', (base_class,), field_dict)
+    if key is not None:
+        _form_cache[key] = form_class
+    return form_class
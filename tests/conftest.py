@@ -0,0 +1,13 @@
+import pytest_asyncio
+from tortoise import Tortoise
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session", autouse=True)
+async def db():
+    await Tortoise.init(
+        db_url="sqlite://:memory:",
+        modules={"models": ["tests"]}
+    )
+    await Tortoise.generate_schemas()
+    yield
+    await Tortoise.close_connections()
@@ -1,9 +1,10 @@
-import unittest
-import asyncio
-from tortoise import Tortoise, fields, run_async
+import pytest
+from tortoise import fields
 from tortoise.models import Model
-from wtforms import fields as f
-from wtftortoise.orm import model_form
+from wtforms import Form, fields as f
+from wtforms.validators import DataRequired, Regexp
+from wtftortoise import orm
+from wtftortoise.orm import ModelConverter, model_fields, model_form
 
 
 class Book(Model):
@@ -12,139 +13,181 @@ class Book(Model):
     content = fields.TextField()
 
 
-async def init_db():
-    await Tortoise.init(
-        db_url="sqlite://test_db.sqlite3",
-        modules={"models": ["__main__"]}
-    )
-    await Tortoise.generate_schemas()
-
-
+@pytest.mark.asyncio(loop_scope="session")
 async def test_book_form_create():
-    await Tortoise.init(
-        db_url="sqlite://test_db.sqlite3",
-        modules={"models": ["__main__"]}
-    )
-
     BookForm = model_form(Book, exclude=['id'])
     form = BookForm(title="Book1", content="Content1")
     instance = Book()
     form.populate_obj(instance)
     await instance.save()
 
+    book = await Book.get(id=instance.id)
+    assert (book.title, book.content) == ("Book1", "Content1")
 
-async def test_book_form_edit():
-    await Tortoise.init(
-        db_url="sqlite://test_db.sqlite3",
-        modules={"models": ["__main__"]}
-    )
 
-    book = await Book.get(id=1)
+@pytest.mark.asyncio(loop_scope="session")
+async def test_book_form_edit():
+    book = await Book.create(title="Book1", content="Content1")
     BookForm = model_form(Book, exclude=['id'])
     form = BookForm(title="Book2", content="Content2")
     form.populate_obj(book)
     await book.save()
 
+    book = await Book.get(id=book.id)
+    assert (book.title, book.content) == ("Book2", "Content2")
 
-class WTFTortoiseTestCase(unittest.TestCase):
-
-    def test_input(self):
-        BookForm = model_form(Book, only=["title"])
-
-        form = BookForm(title='Book title')
-        self.assertEqual(form.data, {'title': 'Book title'})
-
-    def test_book_form(self):
-        BookForm = model_form(Book)
-        form = BookForm()
-        self.assertEqual(list(form._fields.keys()), ['id', 'title', 'content'])
-        self.assertEqual(
-            form.data, {'id': None, 'title': None, 'content': None})
-
-    def test_exclude(self):
-        BookForm = model_form(Book, exclude=["id", "content"])
-
-        form = BookForm()
-        self.assertEqual(list(form._fields.keys()), ['title'])
-        self.assertNotEqual(list(form._fields.keys()),
-                            ['id', 'title', 'content'])
-        self.assertEqual(
-            form.data, {'title': None})
-
-    def test_only(self):
-        BookForm = model_form(Book, only=["title", "content"])
-
-        form = BookForm()
-        self.assertEqual(list(form._fields.keys()), ["title", "content"])
-        self.assertNotEqual(list(form._fields.keys()),
-                            ['id', 'title', 'content'])
-        self.assertEqual(
-            form.data, {'title': None, "content": None})
-
-    def test_new_label_field_args(self):
-        BookForm = model_form(Book, only=["title"], field_args={
-            'title': {
-                'label': 'Your new label'
-            }
-        })
-
-        form = BookForm()
-        for field in form:
-            self.assertEqual(
-                field.label.text, 'Your new label')
-            self.assertNotEqual(
-                field.label.text, 'Title')
-
-    def test_field_types(self):
-        BookForm = model_form(Book)
-
-        form = BookForm()
-        self.assertTrue(isinstance(form.id, f.IntegerField))
-        self.assertTrue(isinstance(form.title, f.StringField))
-        self.assertTrue(isinstance(form.content, f.TextAreaField))
-
-    def test_validators(self):
-        BookForm = model_form(Book)
-
-        form = BookForm()
-        self.assertEqual(
-            form.data, {'id': None, 'title': None, 'content': None})
-        self.assertFalse(form.validate())
-
-    def test_book_form_input(self):
-        BookForm = model_form(Book, exclude=['id'])
-        form = BookForm(title="Book1", content="Content1")
-        self.assertEqual(form.data, {
-            'title': 'Book1',
-            'content': 'Content1',
-        })
-        self.assertTrue(form.validate())
-
-    def async_test_book_form_create(self):
-        result = {
-            'title': 'Book1',
-            'content': 'Content1'
-        }
-        loop = asyncio.get_event_loop()
-        result = loop.run_until_complete(
-            test_book_form_create(result))
-        loop.close()
-        self.assertTrue(result)
-
-    def async_test_book_form_edit(self):
-        result = {
-            'title': 'Book2',
-            'content': 'Content2'
+
+def test_input():
+    BookForm = model_form(Book, only=["title"])
+
+    form = BookForm(title='Book title')
+    assert form.data == {'title': 'Book title'}
+
+
+def test_book_form():
+    BookForm = model_form(Book)
+    form = BookForm()
+    assert list(form._fields.keys()) == ['id', 'title', 'content']
+    assert form.data == {'id': None, 'title': None, 'content': None}
+
+
+def test_exclude():
+    BookForm = model_form(Book, exclude=["id", "content"])
+
+    form = BookForm()
+    assert list(form._fields.keys()) == ['title']
+    assert list(form._fields.keys()) != ['id', 'title', 'content']
+    assert form.data == {'title': None}
+
+
+def test_only():
+    BookForm = model_form(Book, only=["title", "content"])
+
+    form = BookForm()
+    assert list(form._fields.keys()) == ["title", "content"]
+    assert list(form._fields.keys()) != ['id', 'title', 'content']
+    assert form.data == {'title': None, "content": None}
+
+
+def test_new_label_field_args():
+    BookForm = model_form(Book, only=["title"], field_args={
+        'title': {
+            'label': 'Your new label'
         }
-        loop = asyncio.get_event_loop()
-        result = loop.run_until_complete(
-            test_book_form_edit(result))
-        loop.close()
-        self.assertTrue(result)
-
-
-if __name__ == '__main__':
-    run_async(init_db())
-    run_async(test_book_form_create())
-    run_async(test_book_form_edit())
-    unittest.main()
+    })
+
+    form = BookForm()
+    for field in form:
+        assert field.label.text == 'Your new label'
+        assert field.label.text != 'Title'
+
+
+def test_field_types():
+    BookForm = model_form(Book)
+
+    form = BookForm()
+    assert isinstance(form.id, f.IntegerField)
+    assert isinstance(form.title, f.StringField)
+    assert isinstance(form.content, f.TextAreaField)
+
+
+def test_validators():
+    BookForm = model_form(Book)
+
+    form = BookForm()
+    assert form.data == {'id': None, 'title': None, 'content': None}
+    assert not form.validate()
+
+
+def test_book_form_input():
+    BookForm = model_form(Book, exclude=['id'])
+    form = BookForm(title="Book1", content="Content1")
+    assert form.data == {
+        'title': 'Book1',
+        'content': 'Content1',
+    }
+    assert form.validate()
+
+
+def test_form_cache():
+    BookForm = model_form(Book, exclude=['id'])
+    assert model_form(Book, exclude=['id']) is BookForm
+    assert model_form(Book, exclude=['content']) is not BookForm
+
+    field_args = {'title': {'label': 'Name', 'render_kw': {'size': 10}}}
+    assert (model_form(Book, field_args=field_args)
+            is model_form(Book, field_args=field_args))
+
+
+def test_form_cache_keeps_types_apart():
+    IntForm = model_form(Book, only=['title'],
+                         field_args={'title': {'default': 1}})
+    BoolForm = model_form(Book, only=['title'],
+                          field_args={'title': {'default': True}})
+    assert IntForm is not BoolForm
+    assert IntForm().title.default == 1
+    assert BoolForm().title.default is True
+
+    ListForm = model_form(Book, only=['title'], field_args={
+        'title': {'render_kw': {'class': ['a', 'b']}}})
+    TupleForm = model_form(Book, only=['title'], field_args={
+        'title': {'render_kw': {'class': ('a', 'b')}}})
+    assert ListForm is not TupleForm
+
+
+def test_form_cache_skipped():
+    form_count = len(orm._form_cache)
+
+    field_args = {'title': {'validators': [DataRequired()]}}
+    assert (model_form(Book, field_args=field_args)
+            is not model_form(Book, field_args=field_args))
+    assert (model_form(Book, converter=ModelConverter())
+            is not model_form(Book, converter=ModelConverter()))
+    assert (model_form(Book, base_class=type('BaseForm', (Form,), {}))
+            is not model_form(Book, base_class=type('BaseForm', (Form,), {})))
+
+    assert len(orm._form_cache) == form_count
+
+
+def test_model_fields_not_shared():
+    fields = model_fields(Book, only=['title'])
+    fields['title'].kwargs['validators'].append(Regexp('^x'))
+
+    validators = model_fields(Book, only=['title'])['title'].kwargs[
+        'validators']
+    assert not any(isinstance(v, Regexp) for v in validators)
+    form = model_form(Book, only=['title'])()
+    assert not any(isinstance(v, Regexp) for v in form.title.validators)
+
+
+def test_converter_subclass():
+    class UpperLabelConverter(ModelConverter):
+        def __init__(self, converters=None):
+            super().__init__(converters)
+            self.suffix = '!'
+
+        def convert(self, model, prop, field_args):
+            field_args = {'label': prop.model_field_name.upper() + self.suffix}
+            return super().convert(model, prop, field_args)
+
+    BookForm = model_form(Book, only=['title'],
+                          converter=UpperLabelConverter())
+    assert BookForm().title.label.text == 'TITLE!'
+
+
+def test_override_default_converter():
+    def convert_title(model, prop, kwargs):
+        return f.TextAreaField(**kwargs)
+
+    assert isinstance(model_form(Book, only=['title'])().title,
+                      f.StringField)
+    original = ModelConverter.default_converters['CharField']
+    ModelConverter.default_converters['CharField'] = convert_title
+    try:
+        for converter in (None, ModelConverter()):
+            form = model_form(Book, only=['title'], converter=converter)()
+            assert isinstance(form.title, f.TextAreaField)
+    finally:
+        ModelConverter.default_converters['CharField'] = original
+    assert not isinstance(model_form(Book, only=['title'])().title,
+                          f.TextAreaField)